@@ -0,0 +1,106 @@
+import os
+import sys
+
+import numpy
+import pytest
+
+from tinydebug import tinydebug
+from tinydebug.BatchDebugger import BatchDebugger
+from tinydebug.Debugger import Debugger
+from tinydebug.util import func_from_file, write_results
+
+BINARY_SEARCH_PATH = os.path.join(os.path.dirname(tinydebug.__file__), "TestSuite", "binary_search.py")
+BINARY_SEARCH_ARGS = [[[2, 3, 4, 10, 40], 0, 4, x] for x in [2, 10, 40, 7]]
+FAILING_ARGS = [[[2, 3, 4, 10, 40], 0, 4, 10], [[2, 3, 4, 10, 40], 0, 9, 100], [[2, 3, 4, 10, 40], 0, 4, 3], [[1], 0, 5, 9]]
+
+DESCRIBE_SOURCE = """class Box:
+    def __init__(self, value):
+        self.value = value
+
+
+def describe(x):
+    y = x * 2
+    return Box(y)
+"""
+
+
+@pytest.fixture
+def describe_path(tmp_path):
+    path = tmp_path / "describe.py"
+    path.write_text(DESCRIBE_SOURCE)
+    return str(path)
+
+
+def test_line_matrices_match_single_runs():
+    results = BatchDebugger(BINARY_SEARCH_PATH, "binary_search", BINARY_SEARCH_ARGS, ["test"]).run()
+    line_nums = list(results["line_nums"])
+
+    assert results["executions"].shape == (len(BINARY_SEARCH_ARGS), len(line_nums))
+    assert results["times"].shape == results["executions"].shape
+    assert (results["times"] >= 0).all()
+
+    func = func_from_file(BINARY_SEARCH_PATH, "binary_search")
+    for i, func_args in enumerate(BINARY_SEARCH_ARGS):
+        for line in Debugger(func, func_args, ["test"]).run()["line_history"]:
+            assert results["executions"][i, line_nums.index(line["line_num"])] == line["times_executed"]
+
+
+def test_failed_inputs_are_left_out_of_matrices():
+    results = BatchDebugger(BINARY_SEARCH_PATH, "binary_search", FAILING_ARGS, ["test"]).run()
+
+    assert [failed_input["index"] for failed_input in results["failed_inputs"]] == [1, 3]
+    assert all(failed_input["error"].startswith("IndexError") for failed_input in results["failed_inputs"])
+    assert list(results["input_indices"]) == [0, 2]
+    assert results["executions"].shape[0] == 2
+    assert results["returned_values"] == ["3", None, "1", None]
+
+
+def test_variables_are_merged_across_inputs(describe_path):
+    results = BatchDebugger(describe_path, "describe", [[1], [5], [2.5], ["a"]], ["test"]).run()
+    variables = {var["var"]: var for var in results["variables"]}
+
+    assert variables["x"]["types"] == ["<class 'int'>", "<class 'float'>", "<class 'str'>"]
+    assert variables["x"]["range"] == [1, 5]
+    assert variables["x"]["num_inputs"] == 4
+    assert variables["y"]["range"] == [2, 10]
+
+
+def test_parallel_run_matches_sequential_run():
+    sequential = BatchDebugger(BINARY_SEARCH_PATH, "binary_search", FAILING_ARGS, ["test"]).run()
+    parallel = BatchDebugger(BINARY_SEARCH_PATH, "binary_search", FAILING_ARGS, ["test"], processes=2).run()
+
+    assert numpy.array_equal(sequential["line_nums"], parallel["line_nums"])
+    assert numpy.array_equal(sequential["executions"], parallel["executions"])
+    assert numpy.array_equal(sequential["input_indices"], parallel["input_indices"])
+    assert sequential["failed_inputs"] == parallel["failed_inputs"]
+    assert sequential["variables"] == parallel["variables"]
+    assert sequential["returned_values"] == parallel["returned_values"]
+
+
+def test_unpicklable_returned_values_are_stored_as_repr(describe_path, tmp_path):
+    results = BatchDebugger(describe_path, "describe", [[1], [2]], ["test"], processes=2).run()
+
+    assert not results["failed_inputs"]
+    assert all(returned_value.startswith("<debugmodule.Box object") for returned_value in results["returned_values"])
+    write_results(tmp_path / "results.tinydebug", results)
+
+
+def test_parse_reports_batch_results(tmp_path, monkeypatch, capsys):
+    results_path = str(tmp_path / "results.tinydebug")
+    write_results(results_path, BatchDebugger(BINARY_SEARCH_PATH, "binary_search", FAILING_ARGS, ["test"]).run())
+
+    monkeypatch.setattr(sys, "argv", ["tinydebug", "--parse", results_path])
+    tinydebug.main()
+    output = capsys.readouterr().out
+
+    assert output.startswith("Batch results for function binary_search, 4 inputs (2 failed).")
+    assert "Failed inputs:" in output
+
+
+def test_batch_rejects_processes_below_one(tmp_path, monkeypatch):
+    args_path = tmp_path / "inputs.json"
+    args_path.write_text("[[1]]")
+
+    monkeypatch.setattr(sys, "argv", ["tinydebug", "--debug", BINARY_SEARCH_PATH, "--func", "binary_search", "--batch", str(args_path), "--processes", "0"])
+    with pytest.raises(SystemExit):
+        tinydebug.main()
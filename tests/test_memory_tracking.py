@@ -0,0 +1,54 @@
+import sys
+import tracemalloc
+
+import pytest
+
+from tinydebug.Debugger import Debugger
+
+
+def spin(n):
+    x = 0
+    for i in range(n):
+        x = i
+    return x
+
+
+def allocate_and_free(n, iterations):
+    for _ in range(iterations):
+        data = [0] * n
+        del data
+    return 0
+
+
+def allocate_and_raise(n):
+    data = [0] * n
+    raise ValueError(len(data))
+
+
+def test_loop_without_allocations_nets_to_zero_per_line():
+    line_history = Debugger(spin, [200], ["test"], True).run()["line_history"]
+
+    for line in line_history:
+        if line["times_executed"] > 1:
+            assert abs(line["net_memory"]) <= 64
+
+
+def test_allocate_then_free_loop_nets_to_zero():
+    n, iterations = 100000, 20
+    line_history = Debugger(allocate_and_free, [n, iterations], ["test"], True).run()["line_history"]
+    allocating_line = max(line_history, key=lambda line: line["net_memory"])
+    freeing_line = min(line_history, key=lambda line: line["net_memory"])
+
+    # CPython's free lists may keep a container's header allocated, so allow a few bytes per iteration
+    assert abs(allocating_line["net_memory"] - iterations * n * 8) <= iterations * 128
+    assert abs(freeing_line["net_memory"] + iterations * n * 8) <= iterations * 128
+    assert allocating_line["peak_memory"] >= n * 8
+    assert abs(sum(line["net_memory"] for line in line_history)) <= iterations * 128
+
+
+def test_memory_tracking_stops_when_function_raises():
+    with pytest.raises(ValueError):
+        Debugger(allocate_and_raise, [1000], ["test"], True).run()
+
+    assert not tracemalloc.is_tracing()
+    assert sys.gettrace() is None
@@ -0,0 +1,117 @@
+import multiprocessing
+import numpy
+
+from .Debugger import Debugger
+from .util import func_from_file
+
+_worker_func = None
+
+
+def _init_worker(file_path, func_name):
+    """Pool initializer, loads the traced function once per worker process."""
+    global _worker_func
+    _worker_func = func_from_file(file_path, func_name)
+
+
+def _trace_input(func_args, cmd_args, track_memory):
+    """
+    Traces a single input in the current (worker) process, and returns only the parts of the results needed for aggregation.
+    If the function raises, the exception is returned as the input's error instead, so a single bad input doesn't abort the batch.
+    The returned value is kept as its repr, since it may not be picklable (e.g. an instance of a class defined in the traced file).
+    """
+    try:
+        results = Debugger(_worker_func, func_args, cmd_args, track_memory).run()
+    except Exception as e:
+        return {"error": repr(e)}
+    variables = [{"var": var["var"], "type": var["type"], "range": var["range"]} for var in results["variable_history"]]
+    return {"returned_value": repr(results["returned_value"]), "line_history": results["line_history"], "variable_history": variables}
+
+
+class BatchDebugger:
+    """
+    Batch debugger class.
+
+    Receives a function's file path and name and a list of argument lists, traces the function once per argument list
+    (optionally in parallel) and aggregates the line and variable statistics of all runs.
+    If track_memory is set, per-line net and peak memory matrices are aggregated as well.
+    Inputs that raise are recorded in failed_inputs and left out of the aggregated statistics, and input_indices maps each matrix row to its input.
+    """
+
+    def __init__(self, file_path, func_name, func_args_list, cmd_args, processes=1, track_memory=False):
+        self.file_path = str(file_path)
+        self.func_name = func_name
+        self.func_args_list = func_args_list
+        self.cmd_args = cmd_args
+        self.processes = processes
+        self.track_memory = track_memory
+
+        self.results = {"code_info": {"function_name": self.func_name, "num_inputs": len(self.func_args_list), "cmd_args": self.cmd_args, "track_memory": self.track_memory},
+                        "function_args": self.func_args_list, "returned_values": [], "failed_inputs": [], "input_indices": None, "line_nums": None, "executions": None,
+                        "times": None, "net_memory": None, "peak_memory": None, "variables": []}
+
+    def run(self):
+        """
+        Traces the function on every input, and aggregates the results.
+        :return: Aggregated results.
+        """
+        tasks = [(func_args, self.cmd_args, self.track_memory) for func_args in self.func_args_list]
+        if self.processes > 1:
+            with multiprocessing.Pool(self.processes, initializer=_init_worker, initargs=(self.file_path, self.func_name)) as pool:
+                input_results = pool.starmap(_trace_input, tasks)
+        else:
+            _init_worker(self.file_path, self.func_name)
+            input_results = [_trace_input(*task) for task in tasks]
+
+        self.results["returned_values"] = [input_result.get("returned_value") for input_result in input_results]
+        self.results["failed_inputs"] = [{"index": i, "error": input_result["error"]} for i, input_result in enumerate(input_results) if "error" in input_result]
+        self.results["input_indices"] = numpy.array([i for i, input_result in enumerate(input_results) if "error" not in input_result], dtype=numpy.int64)
+
+        input_results = [input_result for input_result in input_results if "error" not in input_result]
+        self.__aggregate_lines(input_results)
+        self.__aggregate_variables(input_results)
+
+        return self.results
+
+    def __aggregate_lines(self, input_results):
+        """Builds the inputs x lines matrices of execution counts and total times, and of net and peak memory if memory is tracked."""
+        line_nums = sorted({line["line_num"] for input_result in input_results for line in input_result["line_history"]})
+        line_index = {line_num: i for i, line_num in enumerate(line_nums)}
+
+        executions = numpy.zeros((len(input_results), len(line_nums)), dtype=numpy.int64)
+        times = numpy.zeros((len(input_results), len(line_nums)), dtype=numpy.float64)
+        net_memory = numpy.zeros((len(input_results), len(line_nums)), dtype=numpy.int64)
+        peak_memory = numpy.zeros((len(input_results), len(line_nums)), dtype=numpy.int64)
+        for i, input_result in enumerate(input_results):
+            for line in input_result["line_history"]:
+                executions[i, line_index[line["line_num"]]] = line["times_executed"]
+                times[i, line_index[line["line_num"]]] = line["total_time"]
+                if self.track_memory:
+                    net_memory[i, line_index[line["line_num"]]] = line["net_memory"]
+                    peak_memory[i, line_index[line["line_num"]]] = line["peak_memory"]
+
+        self.results["line_nums"] = numpy.array(line_nums, dtype=numpy.int64)
+        self.results["executions"] = executions
+        self.results["times"] = times
+        if self.track_memory:
+            self.results["net_memory"] = net_memory
+            self.results["peak_memory"] = peak_memory
+
+    def __aggregate_variables(self, input_results):
+        """Merges the types and value ranges of every variable across all inputs."""
+        variables = {}
+        for input_result in input_results:
+            for var in input_result["variable_history"]:
+                if var["var"] not in variables:
+                    variables[var["var"]] = {"var": var["var"], "types": [], "range": None, "num_inputs": 0}
+                aggregated = variables[var["var"]]
+
+                aggregated["num_inputs"] += 1
+                if var["type"] not in aggregated["types"]:
+                    aggregated["types"].append(var["type"])
+                if var["range"]:
+                    if aggregated["range"]:
+                        aggregated["range"] = [min(aggregated["range"][0], var["range"][0]), max(aggregated["range"][1], var["range"][1])]
+                    else:
+                        aggregated["range"] = list(var["range"])
+
+        self.results["variables"] = list(variables.values())
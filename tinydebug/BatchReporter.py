@@ -0,0 +1,65 @@
+import numpy
+
+from .util import format_bytes
+
+
+class BatchReporter:
+    """Reporter class, summarizes aggregated batch execution results."""
+
+    def __init__(self, results):
+        self.results = results
+
+    def get_summary(self):
+        """
+        Returns a human-readable summary of the aggregated results, as a list of lines.
+        Lines are ordered by their execution count variability across inputs, so data-dependent hot paths are listed first.
+        """
+        code_info = self.results["code_info"]
+        line_nums, executions, times = self.results["line_nums"], self.results["executions"], self.results["times"]
+        net_memory, peak_memory = self.results.get("net_memory"), self.results.get("peak_memory")
+        input_indices, failed_inputs = self.results["input_indices"], self.results["failed_inputs"]
+
+        summary = ["Batch results for function {}, {} inputs ({} failed).".format(code_info["function_name"], code_info["num_inputs"], len(failed_inputs)),
+                   "Command line arguments: {}".format(code_info["cmd_args"]), ""]
+
+        summary.append("Line runtime analysis (per input):")
+        if executions.size:
+            mean_executions, std_executions = executions.mean(axis=0), executions.std(axis=0)
+            mean_times = times.mean(axis=0)
+            for i in numpy.argsort(-std_executions, kind="stable"):
+                line = "Line {}: executed {} - {} times (mean {:0.2f}, std {:0.2f}), mean runtime {:0.5f}s, max runtime {:0.5f}s".format(
+                    line_nums[i], executions[:, i].min(), executions[:, i].max(), mean_executions[i], std_executions[i], mean_times[i], times[:, i].max())
+                if net_memory is not None:
+                    line += ", mean net memory allocated {}, max peak memory allocated {}".format(format_bytes(int(net_memory[:, i].mean())), format_bytes(int(peak_memory[:, i].max())))
+                summary.append(line)
+        summary.append("")
+
+        summary.append("Slowest inputs:")
+        if times.size:
+            total_times = times.sum(axis=1)
+            for i in numpy.argsort(-total_times, kind="stable")[:5]:
+                summary.append("Input {}: {} steps, total runtime {:0.5f}s, arguments {}".format(input_indices[i], executions[i].sum(), total_times[i],
+                                                                                               self.results["function_args"][input_indices[i]]))
+        summary.append("")
+
+        if failed_inputs:
+            summary.append("Failed inputs:")
+            for failed_input in failed_inputs:
+                summary.append("Input {}: {}, arguments {}".format(failed_input["index"], failed_input["error"], self.results["function_args"][failed_input["index"]]))
+            summary.append("")
+
+        summary.append("Variable analysis:")
+        for var in self.results["variables"]:
+            line = "Variable '{}' (types {}), present in {} inputs.".format(var["var"], ", ".join(var["types"]), var["num_inputs"])
+            if var["range"]:
+                line += " Value range: {} - {}.".format(var["range"][0], var["range"][1])
+            summary.append(line)
+
+        return summary
+
+    def print_results(self):
+        print("\n".join(self.get_summary()))
+
+    def write_summary(self, file_path):
+        with open(file_path, "w") as f:
+            f.write("\n".join(self.get_summary()) + "\n")
@@ -1,6 +1,8 @@
 import os
 from datetime import datetime
 
+from .util import format_bytes
+
 
 class ConsoleReporter:
     """Reporter class, reports program execution results to console."""
@@ -76,5 +78,8 @@ class ConsoleReporter:
         print("\033[95m", end="")
         for line in line_history:
             print("Line {}: executed {} times, total runtime {}s, average runtime {}s".format(line["line_num"], line["times_executed"], "{0:0.5f}".format(line["total_time"]),
-                                                                                              "{0:0.5f}".format(line["total_time"] / line["times_executed"])))
+                                                                                              "{0:0.5f}".format(line["total_time"] / line["times_executed"])), end="")
+            if "net_memory" in line:
+                print(", net memory allocated {}, peak memory allocated {}".format(format_bytes(line["net_memory"]), format_bytes(line["peak_memory"])), end="")
+            print()
         print("\033[0m", end="")
@@ -1,6 +1,9 @@
 import sys
 import copy
+import pickle
 import time
+import tracemalloc
+import warnings
 
 
 class Debugger:
@@ -8,33 +11,50 @@ class Debugger:
     Debugger class.
 
     Receives a function object and function arguments in a list, runs the function while tracing it and produces results.
+    If track_memory is set, memory allocated by each line is measured as well, using tracemalloc.
+    Memory tracking resets tracemalloc's peak on every line, and slows down tracing about 3 times.
     """
 
-    def __init__(self, func, func_args, cmd_args):
+    def __init__(self, func, func_args, cmd_args, track_memory=False):
         self.func = func
         self.func_name = func.__name__
         self.func_args = func_args
         self.cmd_args = cmd_args
+        self.track_memory = track_memory
 
         self.curr_line = None
         self.prev_variables = {}
         self.variable_history = {}
         self.line_history = {}
         self.prev_time = time.time()
+        self.prev_memory = 0
         self.step = 1
 
-        self.results = {"code_info": {"function_name": self.func_name, "function_args": self.func_args, "cmd_args": self.cmd_args}, "execution_log": [], "variable_history": [], "line_history": []}
+        self.results = {"code_info": {"function_name": self.func_name, "function_args": self.func_args, "cmd_args": self.cmd_args, "track_memory": self.track_memory},
+                        "execution_log": [], "variable_history": [], "line_history": []}
 
     def run(self):
         """
         Runs the function, and traces it.
         :return: Analyzed tracing results.
         """
+        was_tracing_memory = tracemalloc.is_tracing()
+        if self.track_memory:
+            if was_tracing_memory:
+                warnings.warn("tracemalloc is already tracing, its peak will be reset while tracking the memory of each line", RuntimeWarning)
+            else:
+                tracemalloc.start()
+
         sys.settrace(self.__trace_calls)
+        self.__reset_memory()
         self.prev_time = time.time()
         sys.argv = self.cmd_args
-        self.results["returned_value"] = self.func(*self.func_args)
-        sys.settrace(None)
+        try:
+            self.results["returned_value"] = self.func(*self.func_args)
+        finally:
+            sys.settrace(None)
+            if self.track_memory and not was_tracing_memory:
+                tracemalloc.stop()
 
         self.results["variable_history"] = [var_obj.get_dict() for var_obj in self.variable_history.values()]
         self.results["line_history"] = [line_obj.get_dict() for line_obj in self.line_history.values()]
@@ -47,23 +67,65 @@ class Debugger:
         if frame.f_code.co_name == self.func_name:
             return self.__trace_lines
 
+    def __reset_memory(self):
+        """Sets the baseline for measuring the memory allocated by the next line, if memory is tracked."""
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            self.prev_memory = tracemalloc.get_traced_memory()[0]
+
+    def __copy_variables(self, variables):
+        """
+        Returns a copy of the variables, to store in the results.
+        When memory is tracked the copy is made by pickling, since deepcopy returns immutable values (like str and bytes) as is,
+        and keeping them alive would hide the memory freed by the traced function. Unpicklable variables fall back to deepcopy.
+        """
+        if self.track_memory:
+            try:
+                return pickle.loads(pickle.dumps(variables, pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                pass
+        return copy.deepcopy(variables)
+
+    def __read_memory(self):
+        """Returns the net and peak bytes allocated since the baseline was set, or None if memory isn't tracked."""
+        if self.track_memory:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            return current_memory - self.prev_memory, peak_memory - self.prev_memory
+
     def __trace_lines(self, frame, event, arg):
-        """Runs every line executed in the traced function, and analyzes the changes in variables."""
+        """
+        Runs every line executed in the traced function, and analyzes the changes in variables.
+        Memory is read before anything else and the baseline is reset last, so the tracer's own allocations aren't charged to the traced lines.
+        """
+        # Accessing f_locals refreshes it, dropping its references to objects the line unbound, so their memory is freed before it's read
+        current_variables = frame.f_locals
+        line_memory = self.__read_memory()
+        line_time = time.time() - self.prev_time
+
+        self.__analyze_line(frame, current_variables, line_time, line_memory)
+        del current_variables, line_memory, line_time
+
+        self.__reset_memory()
+        self.prev_time = time.time()
+
+    def __analyze_line(self, frame, current_variables, line_time, line_memory):
+        """Logs the line that was just executed, and the changes in variables it made."""
         curr_execution_log = {"step": self.step, "timestamp": time.time(), "line_num": self.curr_line, "actions": []}
         self.results["execution_log"].append(curr_execution_log)
 
         if self.curr_line not in self.line_history:
             self.line_history[self.curr_line] = Line(self.curr_line)
-        self.line_history[self.curr_line].run_line(time.time() - self.prev_time)
+        self.line_history[self.curr_line].run_line(line_time, line_memory)
         curr_execution_log["line_runtime"] = self.line_history[self.curr_line].get_dict()
 
         self.is_first_print_for_this_line = True
-        current_variables = frame.f_locals
-        for var, val in current_variables.items():
+        # Only copies of new and changed variables are stored, so the tracer never keeps the traced function's objects alive
+        changed_variables = self.__copy_variables({var: val for var, val in current_variables.items() if var not in self.prev_variables or self.prev_variables[var] != val})
+        for var, val in changed_variables.items():
             if var not in self.prev_variables:
                 curr_execution_log["actions"].append({"action": "init_var", "var": var, "val": val})
-                self.variable_history[var] = Variable(var, self.curr_line, self.step, copy.deepcopy(val))
-            elif self.prev_variables[var] != val:
+                self.variable_history[var] = Variable(var, self.curr_line, self.step, val)
+            else:
                 prev_val = self.prev_variables[var]
                 if isinstance(prev_val, list) and isinstance(val, list):
                     self.__compare_lists(var, prev_val, val)
@@ -71,10 +133,9 @@ class Debugger:
                     self.__compare_dictionaries(var, prev_val, val)
                 else:
                     curr_execution_log["actions"].append({"action": "change_var", "var": var, "prev_val": prev_val, "new_val": val})
-                self.variable_history[var].add_value(self.step, self.curr_line, copy.deepcopy(val))
+                self.variable_history[var].add_value(self.step, self.curr_line, val)
 
-        self.prev_variables = copy.deepcopy(current_variables)
-        self.prev_time = time.time()
+        self.prev_variables = {var: changed_variables[var] if var in changed_variables else self.prev_variables[var] for var in current_variables}
         self.curr_line = frame.f_lineno
         self.step += 1
 
@@ -157,24 +218,36 @@ class Line:
     """
     Represents a line, used in the Debugger class.
     Stores line number, number of times the line was executed and total time spent running the line.
+    If memory is tracked, also stores the net bytes allocated by the line and the peak bytes allocated by a single execution of it.
     """
 
     def __init__(self, line_num):
         self.line_num = line_num
         self.times_executed = 0
         self.total_time = 0
+        self.net_memory = None
+        self.peak_memory = None
 
-    def run_line(self, time):
+    def run_line(self, time, memory=None):
         """
         Stores an execution of the line, and updates the relevant variables.
 
         :param float time: Time in seconds the line took to execute.
+        :param (int, int) memory: Net and peak bytes allocated while executing the line, or None if memory isn't tracked.
         """
         self.times_executed += 1
         self.total_time += time
+        if memory is not None:
+            net_memory, peak_memory = memory
+            self.net_memory = (self.net_memory or 0) + net_memory
+            self.peak_memory = max(self.peak_memory or 0, peak_memory)
 
     def get_dict(self):
         """
         Returns a dictionary representation of the line, to store for use by reporters.
         """
-        return {"line_num": self.line_num, "times_executed": self.times_executed, "total_time": self.total_time}
+        line_dict = {"line_num": self.line_num, "times_executed": self.times_executed, "total_time": self.total_time}
+        if self.net_memory is not None:
+            line_dict["net_memory"] = self.net_memory
+            line_dict["peak_memory"] = self.peak_memory
+        return line_dict
@@ -6,6 +6,8 @@ import yaml
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
 
+from .util import format_bytes
+
 
 class VideoReporter:
     """Reporter class, reports program execution results to as a video."""
@@ -94,6 +96,10 @@ class VideoReporter:
         draw.text((0, frame_size[1] * 0.8 + font_size),
                   "Times executed: {}, time spent: {}".format(current_step['line_runtime']['times_executed'], "{0:.2f}".format(current_step['line_runtime']['total_time'])),
                   font=font, fill=self.color_theme["text-color"])
+        if "net_memory" in current_step['line_runtime']:
+            draw.text((0, frame_size[1] * 0.8 + font_size * 2),
+                      "Net memory: {}, peak memory: {}".format(format_bytes(current_step['line_runtime']['net_memory']), format_bytes(current_step['line_runtime']['peak_memory'])),
+                      font=font, fill=self.color_theme["text-color"])
 
         # Variable section
         current_text_y = 0
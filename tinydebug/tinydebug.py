@@ -1,6 +1,9 @@
 import argparse
+import json
 import os
 
+from .BatchDebugger import BatchDebugger
+from .BatchReporter import BatchReporter
 from .Debugger import Debugger
 from .ConsoleReporter import ConsoleReporter
 from .TestSuite import TestSuite
@@ -34,6 +37,17 @@ def main():
                                                           "(if --output FILE is not provided, the results are printed to console)",
                                                           "Example: \"--output result.tinydebug\" saves the results in an internal format to the file result.tinydebug",
                                                           "Example: \"--output video.mp4\" generates a video and saves it as video.mp4."]), metavar="FILE")
+    debug_group.add_argument("--memory", help=".\n".join(["If --debug FILE is present, optionally track the net and peak memory allocated by each line",
+                                                          "Tracing is about 3 times slower with memory tracking"]),
+                             action="store_true")
+    debug_group.add_argument("--batch", help=".\n".join(["If --debug FILE is present, optionally provide a JSON file containing a list of argument lists, to trace FUNC once per argument list",
+                                                         "The line and variable statistics of all runs are aggregated, and saved to --output FILE along with a summary report FILE.summary.txt",
+                                                         "(FUNC can't be given parameters, and --output FILE can't be a video)",
+                                                         "(if --output FILE is not provided, the summary is printed to console)",
+                                                         "Example: \"--func foo --batch inputs.json\" with inputs.json containing [[1, 2], [3, 4]] will run foo(1, 2) and foo(3, 4)."]),
+                             metavar="ARGS_FILE")
+    debug_group.add_argument("--processes", help="If --batch ARGS_FILE is present, optionally provide the number of processes to trace the inputs with (defaults to 1).", type=int,
+                             default=1, metavar="N")
 
     parse_group = parser.add_argument_group(title="Parsing and Reporting", description="Parsing analysis results and reporting them in console in human-readable form.")
     parse_group.add_argument("--parse", help=".\n".join(["Path of a file generated by this program, to print in human-readable form",
@@ -55,6 +69,28 @@ def main():
 
     if args.test is not None:
         TestSuite.run_all_tests(args.test)
+    elif args.debug and args.batch:
+        if len(args.func) > 1:
+            parser.error("--batch takes the function arguments from ARGS_FILE, --func should only name the function")
+        if args.processes < 1:
+            parser.error("--processes should be at least 1")
+        if args.output and Path(args.output).suffix in [".mp4", ".gif"]:
+            parser.error("--batch results can't be saved as a video, use an internal format file for --output")
+
+        with open(args.batch) as f:
+            func_args_list = json.load(f)
+        if not isinstance(func_args_list, list) or not all(isinstance(func_args, list) for func_args in func_args_list):
+            parser.error("ARGS_FILE should contain a JSON list of argument lists, such as [[1, 2], [3, 4]]")
+
+        debugger = BatchDebugger(args.debug, args.func[0], func_args_list, [args.debug] + args.args, args.processes, args.memory)
+        results = debugger.run()
+
+        reporter = BatchReporter(results)
+        if args.output:
+            write_results(args.output, results)
+            reporter.write_summary(args.output + ".summary.txt")
+        else:
+            reporter.print_results()
     elif args.debug:
         debug_file_path = args.debug
 
@@ -62,7 +98,7 @@ def main():
         func = func_from_file(debug_file_path, func_name)
         func_args = [parse_func_arg(arg) for arg in args.func[1:]]
 
-        debugger = Debugger(func, func_args, [debug_file_path] + args.args)
+        debugger = Debugger(func, func_args, [debug_file_path] + args.args, args.memory)
         results = debugger.run()
 
         output_file_path = args.output
@@ -78,7 +114,11 @@ def main():
             reporter = ConsoleReporter(results)
             reporter.print_results()
     elif args.parse:
-        reporter = ConsoleReporter(read_results(args.parse))
+        results = read_results(args.parse)
+        if "executions" in results:
+            reporter = BatchReporter(results)
+        else:
+            reporter = ConsoleReporter(results)
         reporter.print_results()
     elif args.video:
         reporter = VideoReporter(func_from_file(args.video[0], args.video[1]), read_results(args.video[2]), args.video_config)
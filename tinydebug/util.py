@@ -18,3 +18,13 @@ def write_results(file_path, results):
 def read_results(file_path):
     with open(file_path, "rb") as f:
         return pickle.load(f)
+
+
+def format_bytes(num_bytes):
+    if abs(num_bytes) < 1024:
+        return "{}B".format(num_bytes)
+    for unit in ["KiB", "MiB"]:
+        num_bytes /= 1024
+        if abs(num_bytes) < 1024:
+            return "{:0.1f}{}".format(num_bytes, unit)
+    return "{:0.1f}GiB".format(num_bytes / 1024)